@@ -1,6 +1,20 @@
+import os
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import numpy as np
 import streamlit as st
 import pandas as pd
-import requests
+
+if TYPE_CHECKING:
+    import requests
+
+try:
+    import orjson
+except ImportError:  # opcional: decodificador JSON más rápido
+    orjson = None
 
 # ─────────────────────────────────────────────
 # Configuración de la página
@@ -36,75 +50,272 @@ st.sidebar.info(
 
 # URL base de la API de CGSpace (DSpace 7)
 CGSPACE_API_URL = "https://cgspace.cgiar.org/server/api/discover/search/objects"
+# Prefijo de los enlaces a cada documento (se completa con su handle)
+CGSPACE_HANDLE_URL = "https://cgspace.cgiar.org/handle/"
+
+# Claves de metadatos que se prueban en orden para cada campo de la API
+CLAVES_AÑO = ("dcterms.issued", "dc.date.issued")
+CLAVES_PAIS = ("cg.country", "cg.coverage.country", "dc.coverage.spatial")
+CLAVES_PALABRAS = ("cg.subject", "dc.subject", "dcterms.subject")
+
+# Datos locales: CSV de origen y copia columnar (Feather/Arrow IPC) generada a partir de él
+RUTA_CSV = "cgspace_demo.csv"
+RUTA_ARROW = "cgspace_demo.arrow"
+# Versión del formato de la copia Feather (en los metadatos del esquema): al cambiar
+# cómo se parsea el CSV, las copias con otra versión se regeneran
+FORMATO_ARROW = {b"formato": b"2"}
 
 # ─────────────────────────────────────────────
 # Cargar datos locales de CGSpace desde CSV
 # ─────────────────────────────────────────────
+def _leer_con_pyarrow() -> pd.DataFrame:
+    """
+    Lee la copia Feather si está al día respecto al CSV; si no, parsea el CSV
+    con pyarrow y guarda la copia para los siguientes arranques.
+
+    Ambos ficheros se leen con memory-map, lo que solo evita la copia de lectura
+    a un buffer propio durante esta carga única (la copia Feather se guarda sin
+    comprimir para no tener que descomprimirla). El DataFrame resultante sigue
+    siendo privado: las conversiones de tipos de cargar_datos_locales y
+    st.cache_data, que devuelve una copia en cada llamada, lo copian igualmente.
+    """
+    import pyarrow
+    import pyarrow.csv
+    import pyarrow.feather
+
+    tabla = None
+    if (
+        os.path.exists(RUTA_ARROW)
+        and os.path.getmtime(RUTA_ARROW) >= os.path.getmtime(RUTA_CSV)
+    ):
+        try:
+            tabla = pyarrow.feather.read_table(RUTA_ARROW, memory_map=True)
+        except (pyarrow.ArrowInvalid, OSError):
+            # Copia dañada o incompleta: se vuelve a generar desde el CSV
+            tabla = None
+        else:
+            if (tabla.schema.metadata or {}).get(b"formato") != FORMATO_ARROW[b"formato"]:
+                # Copia de una versión anterior del parseo
+                tabla = None
+
+    if tabla is None:
+        with pyarrow.memory_map(RUTA_CSV, "r") as mm:
+            tabla = pyarrow.csv.read_csv(
+                mm,
+                read_options=pyarrow.csv.ReadOptions(use_threads=True, block_size=1 << 20),
+                # Celdas vacías como nulos (como pd.read_csv), no como ""
+                convert_options=pyarrow.csv.ConvertOptions(strings_can_be_null=True),
+            )
+        tabla = tabla.replace_schema_metadata(FORMATO_ARROW)
+        # Escritura atómica: fichero temporal en el mismo directorio + os.replace,
+        # así otro proceso nunca ve una copia a medio escribir
+        tmp = None
+        try:
+            fd, tmp = tempfile.mkstemp(
+                prefix=os.path.basename(RUTA_ARROW) + ".",
+                suffix=".tmp",
+                dir=os.path.dirname(os.path.abspath(RUTA_ARROW)),
+            )
+            os.close(fd)
+            pyarrow.feather.write_feather(tabla, tmp, compression="uncompressed")
+            os.chmod(tmp, 0o644)  # mkstemp crea el fichero con 0600
+            os.replace(tmp, RUTA_ARROW)
+        except OSError:
+            # Sistema de archivos de solo lectura: seguimos sin la copia
+            if tmp is not None and os.path.exists(tmp):
+                os.remove(tmp)
+
+    return tabla.to_pandas(types_mapper=pd.ArrowDtype)
+
+
 @st.cache_data(show_spinner=True)
 def cargar_datos_locales() -> pd.DataFrame:
-    df = pd.read_csv("cgspace_demo.csv")
+    try:
+        # Copia Feather o lector multihilo de pyarrow (mucho más rápido que el motor C)
+        df = _leer_con_pyarrow()
+        tipo_texto = "string[pyarrow]"
+    except ImportError:
+        # Sin pyarrow: motor C de pandas con tipos declarados de antemano
+        df = pd.read_csv(
+            RUTA_CSV,
+            low_memory=False,
+            cache_dates=True,
+            dtype={"Año": "Int16"},
+        )
+        tipo_texto = "string"
     # Aseguramos tipos
     if "Año" in df.columns:
         df["Año"] = pd.to_numeric(df["Año"], errors="coerce")
+    # Columnas de texto con dtype string (kernels vectorizados de Arrow para .str)
+    for col in ["Título", "País", "PalabrasClave"]:
+        if col in df.columns:
+            df[col] = df[col].astype(tipo_texto)
+    # Columna auxiliar de búsqueda: texto combinado y en minúsculas, calculado una sola vez
+    columnas_texto = [c for c in ["Título", "País", "PalabrasClave"] if c in df.columns]
+    if columnas_texto:
+        combinado = df[columnas_texto[0]].fillna("")
+        for col in columnas_texto[1:]:
+            combinado = combinado + " \x1f " + df[col].fillna("")
+        df["_search"] = combinado.str.lower().astype(tipo_texto)
+    # País como categoría: pocos valores distintos → códigos enteros de 1-2 bytes por fila
+    if "País" in df.columns:
+        df["País"] = df["País"].astype("category")
     return df
 
 
 df_base = cargar_datos_locales()
 
+
+# ─────────────────────────────────────────────
+# Índice invertido (token → filas) sobre la columna de búsqueda
+# ─────────────────────────────────────────────
+@st.cache_resource(show_spinner=False)
+def construir_indice(_df: pd.DataFrame) -> dict[str, np.ndarray]:
+    """
+    Construye un índice invertido sobre `_search`: para cada token (\\w+) guarda
+    un array ordenado (int32) con las posiciones de las filas que lo contienen.
+
+    Se construye una sola vez por proceso (df_base es inmutable bajo caché).
+    """
+    if "_search" not in _df.columns:
+        return {}
+
+    postings: dict[str, list[int]] = {}
+    for fila, texto in enumerate(_df["_search"].fillna("")):
+        for token in set(re.findall(r"\w+", texto)):
+            postings.setdefault(token, []).append(fila)
+
+    return {token: np.asarray(filas, dtype=np.int32) for token, filas in postings.items()}
+
+
+# Tokens más cortos (1-2 letras) aparecen en gran parte del vocabulario: recorrerlo
+# en Python es más lento que un str.contains vectorizado sobre la columna
+LONGITUD_MIN_INDICE = 3
+
+
+def _filas_con_token(indice: dict[str, np.ndarray], busqueda: pd.Series, token: str) -> np.ndarray:
+    """
+    Filas donde algún token del índice contiene `token` (recorre el vocabulario, no las filas).
+    Los tokens de una o dos letras se buscan directamente en la columna `busqueda`.
+    """
+    if len(token) < LONGITUD_MIN_INDICE:
+        coincide = busqueda.str.contains(token, regex=False, na=False).to_numpy()
+        return np.flatnonzero(coincide).astype(np.int32)
+
+    listas = [filas for t, filas in indice.items() if token in t]
+    if not listas:
+        return np.empty(0, dtype=np.int32)
+    return np.unique(np.concatenate(listas))
+
+
 # ─────────────────────────────────────────────
 # Herramienta del agente: búsqueda local (CSV)
 # ─────────────────────────────────────────────
-def buscar_localmente(query: str, df: pd.DataFrame, max_results: int = 200) -> pd.DataFrame:
+@st.cache_data(max_entries=256, ttl=600, show_spinner=False)
+def buscar_localmente(query: str, max_results: int = 200) -> pd.DataFrame:
     """
-    Busca la query en varias columnas de texto del DataFrame:
+    Busca la query en varias columnas de texto de `df_base`:
     - Título
     - País
     - PalabrasClave
 
     Es una búsqueda simple (contiene, sin mayúsculas/minúsculas),
-    suficiente para una demo estable.
+    suficiente para una demo estable. Si la query tiene varias palabras,
+    basta con que aparezca cualquiera de ellas.
+
+    Los resultados se memorizan por (query, max_results): df_base es inmutable
+    bajo caché, así que repetir una consulta no vuelve a recorrer los datos.
     """
-    if not query or df.empty:
+    if not query or not query.strip() or df_base.empty:
         return pd.DataFrame()
 
-    q = query.lower()
+    if "_search" not in df_base.columns:
+        return pd.DataFrame()
 
-    columnas_texto = []
-    for col in ["Título", "País", "PalabrasClave"]:
-        if col in df.columns:
-            columnas_texto.append(col)
+    q = query.strip().lower()
+    busqueda = df_base["_search"]
+    palabras = q.split()
+    tokens = re.findall(r"\w+", q)
+    if len(palabras) > 1:
+        if all(re.fullmatch(r"\w+", p) for p in palabras):
+            # Palabras simples: unión de sus listas de filas en el índice
+            indice = construir_indice(df_base)
+            filas = np.unique(np.concatenate([_filas_con_token(indice, busqueda, p) for p in palabras]))
+            mask = np.zeros(len(df_base), dtype=bool)
+            mask[filas] = True
+        else:
+            # Palabras con signos: una sola expresión regular (a|b|c) en una pasada
+            patron = "|".join(re.escape(p) for p in palabras)
+            mask = df_base["_search"].str.contains(patron, regex=True, na=False)
+    elif not tokens:
+        mask = df_base["_search"].str.contains(q, regex=False, na=False)
+    else:
+        # Candidatos: intersección de las listas de filas de cada token
+        indice = construir_indice(df_base)
+        filas = _filas_con_token(indice, busqueda, tokens[0])
+        for token in tokens[1:]:
+            if filas.size == 0:
+                break
+            filas = np.intersect1d(filas, _filas_con_token(indice, busqueda, token), assume_unique=True)
 
-    if not columnas_texto:
-        return pd.DataFrame()
+        mask = np.zeros(len(df_base), dtype=bool)
+        mask[filas] = True
 
-    mask = False
-    for col in columnas_texto:
-        mask = mask | df[col].astype(str).str.lower().str.contains(q)
+        # Palabras con signos (p. ej. "climate-smart"): se confirma con str.contains solo sobre los candidatos
+        if tokens != [q] and filas.size:
+            mask[filas] = df_base["_search"].iloc[filas].str.contains(q, regex=False, na=False).to_numpy()
 
-    resultados = df[mask].copy()
+    idx = np.flatnonzero(np.asarray(mask))
 
-    # Orden por año (más recientes primero) si existe
-    if "Año" in resultados.columns:
-        resultados = resultados.sort_values("Año", ascending=False)
+    # Orden por año (más recientes primero, sin año al final) si existe.
+    # Solo se ordenan los max_results primeros: selección parcial + orden de k filas.
+    if "Año" in df_base.columns and idx.size:
+        clave = -df_base["Año"].iloc[idx].to_numpy(dtype="float64", na_value=np.nan)
+        clave[np.isnan(clave)] = np.inf
+        if 0 < max_results < idx.size:
+            top = np.argpartition(clave, max_results - 1)[:max_results]
+            idx = idx[top[np.argsort(clave[top], kind="stable")]]
+        else:
+            idx = idx[np.argsort(clave, kind="stable")]
 
-    return resultados.head(max_results)
+    return df_base.take(idx[:max_results]).drop(columns="_search")
 
 
 # ─────────────────────────────────────────────
 # Herramienta del agente: búsqueda en API de CGSpace
 # ─────────────────────────────────────────────
-@st.cache_data(ttl=600, show_spinner=True)
-def buscar_en_cgspace_api(query: str, page: int = 0, size: int = 50) -> pd.DataFrame:
+@st.cache_resource(show_spinner=False)
+def _http() -> "requests.Session":
     """
-    Llama a la API REST de CGSpace (DSpace 7) usando el endpoint de búsqueda (Discovery).
-    Devuelve un DataFrame con columnas: Título, Año, País (si se encuentra), Enlace, PalabrasClave.
+    Sesión HTTP compartida: reutiliza conexiones (TCP/TLS) entre llamadas a la API
+    y reintenta con espera exponencial corta ante errores 5xx. Un 429 no se reintenta:
+    llega al usuario como error (ver el aviso del menú lateral) en vez de dejar el
+    script esperando lo que diga la cabecera Retry-After.
 
-    NOTA: La estructura exacta de metadatos puede variar; algunos campos pueden salir vacíos
-    y requerir ajuste según la configuración de CGSpace.
+    `requests` se importa aquí y no al inicio: el modo CSV local nunca lo carga.
     """
-    if not query:
-        return pd.DataFrame()
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    s = requests.Session()
+    reintentos = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[500, 502, 503, 504],
+        # Retry-After (p. ej. en un 503) podría dormir el hilo sin límite, fuera del timeout
+        respect_retry_after_header=False,
+    )
+    s.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=reintentos))
+    s.headers.update({"Accept-Encoding": "gzip"})
+    return s
 
+
+def _pedir_pagina(sesion: "requests.Session", query: str, page: int, size: int) -> dict[str, list]:
+    """
+    Pide una página a la API de CGSpace y la convierte en columnas (listas) con
+    Título, Año, País, Enlace y PalabrasClave. Se ejecuta en un hilo propio.
+    """
     params = {
         "query": query,
         "page": page,
@@ -112,9 +323,9 @@ def buscar_en_cgspace_api(query: str, page: int = 0, size: int = 50) -> pd.DataF
         "sort": "dcterms.issued,desc",
     }
 
-    resp = requests.get(CGSPACE_API_URL, params=params, timeout=30)
+    resp = sesion.get(CGSPACE_API_URL, params=params, timeout=30)
     resp.raise_for_status()
-    data = resp.json()
+    data = orjson.loads(resp.content) if orjson is not None else resp.json()
 
     objects = (
         data.get("_embedded", {})
@@ -123,56 +334,126 @@ def buscar_en_cgspace_api(query: str, page: int = 0, size: int = 50) -> pd.DataF
         .get("objects", [])
     )
 
-    filas = []
+    titulos, anios, paises, handles, palabras_clave = [], [], [], [], []
     for obj in objects:
         indexable = obj.get("_embedded", {}).get("indexableObject", {})
         metadata = indexable.get("metadata", {})
-        handle = indexable.get("handle")
-        enlace = f"https://cgspace.cgiar.org/handle/{handle}" if handle else None
+        handles.append(indexable.get("handle"))
 
         # Título
-        titulo = None
-        if "dc.title" in metadata:
-            titulo = metadata["dc.title"][0].get("value")
-        elif "dcterms.title" in metadata:
-            titulo = metadata["dcterms.title"][0].get("value")
-        else:
-            titulo = indexable.get("name")
+        titulo = (
+            metadata.get("dc.title")
+            or metadata.get("dcterms.title")
+            or [{"value": indexable.get("name")}]
+        )[0].get("value")
 
         # Año (intentamos dcterms.issued o dc.date.issued)
         año = None
-        for key in ["dcterms.issued", "dc.date.issued"]:
-            if key in metadata:
-                v = metadata[key][0].get("value", "")
-                if isinstance(v, str) and len(v) >= 4 and v[:4].isdigit():
-                    año = int(v[:4])
+        for key in CLAVES_AÑO:
+            if v := metadata.get(key):
+                valor = v[0].get("value", "")
+                if isinstance(valor, str) and len(valor) >= 4 and valor[:4].isdigit():
+                    año = int(valor[:4])
                     break
 
         # País (esto depende de cómo CGSpace configure los metadatos)
         pais = None
-        for key in ["cg.country", "cg.coverage.country", "dc.coverage.spatial"]:
-            if key in metadata:
-                pais = metadata[key][0].get("value")
+        for key in CLAVES_PAIS:
+            if v := metadata.get(key):
+                pais = v[0].get("value")
                 break
 
         # Palabras clave (temas)
         palabras = []
-        for key in ["cg.subject", "dc.subject", "dcterms.subject"]:
-            if key in metadata:
-                palabras = [entry.get("value") for entry in metadata[key]]
+        for key in CLAVES_PALABRAS:
+            if v := metadata.get(key):
+                palabras = [entry.get("value") for entry in v]
                 break
 
-        filas.append(
-            {
-                "Título": titulo,
-                "Año": año,
-                "País": pais,
-                "Enlace": enlace,
-                "PalabrasClave": "; ".join(palabras) if palabras else None,
-            }
-        )
+        titulos.append(titulo)
+        anios.append(año)
+        paises.append(pais)
+        palabras_clave.append("; ".join(palabras) if palabras else None)
+
+    # Enlaces: concatenación vectorizada del prefijo (handles vacíos → sin enlace)
+    enlaces = pd.Series(handles, dtype="string").replace("", pd.NA).radd(CGSPACE_HANDLE_URL)
+    enlaces = enlaces.astype(object).where(enlaces.notna(), None).tolist()
+
+    return {
+        "Título": titulos,
+        "Año": anios,
+        "País": paises,
+        "Enlace": enlaces,
+        "PalabrasClave": palabras_clave,
+    }
+
+
+@st.cache_data(ttl=600, show_spinner=True)
+def buscar_en_cgspace_api(query: str, page: int = 0, size: int = 50) -> pd.DataFrame:
+    """
+    Llama a la API REST de CGSpace (DSpace 7) usando el endpoint de búsqueda (Discovery).
+    Devuelve un DataFrame con columnas: Título, Año, País (si se encuentra), Enlace, PalabrasClave.
 
-    return pd.DataFrame(filas)
+    La página pedida se divide en dos sub-páginas de la mitad de tamaño que se piden
+    en paralelo, de modo que el parseo de una se solapa con la red de la otra.
+
+    NOTA: La estructura exacta de metadatos puede variar; algunos campos pueden salir vacíos
+    y requerir ajuste según la configuración de CGSpace.
+    """
+    if not query:
+        return pd.DataFrame()
+
+    # Registros [page*size, page*size + size) = sub-páginas 2*page y 2*page+1 de tamaño size/2
+    partes = 2 if size >= 2 and size % 2 == 0 else 1
+    sesion = _http()
+
+    # Hilos propios de esta llamada: una búsqueda lenta no bloquea las de otras sesiones
+    columnas: dict[str, list] = {}
+    with ThreadPoolExecutor(max_workers=partes, thread_name_prefix="cgspace-api") as pool:
+        futuros = [
+            pool.submit(_pedir_pagina, sesion, query, page * partes + i, size // partes)
+            for i in range(partes)
+        ]
+        for futuro in futuros:
+            for nombre, valores in futuro.result().items():
+                columnas.setdefault(nombre, []).extend(valores)
+
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return pd.DataFrame(columnas)
+
+    # Columnas construidas directamente como arrays de Arrow (sin lista de dicts intermedia)
+    tipos = {"Año": pa.int64()}
+    tabla = pa.table(
+        {nombre: pa.array(valores, type=tipos.get(nombre, pa.string())) for nombre, valores in columnas.items()}
+    )
+    return tabla.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+# ─────────────────────────────────────────────
+# Opciones de los filtros del panel
+# ─────────────────────────────────────────────
+def valores_unicos_ordenados(serie: pd.Series) -> list:
+    """
+    Valores únicos ordenados de una columna de resultados.
+
+    No se memoriza: con resultados de como mucho unos cientos de filas, hashear
+    y serializar la columna para st.cache_data cuesta más que calcularlo.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError:
+        return sorted(serie.dropna().unique().tolist())
+
+    if isinstance(serie.dtype, pd.CategoricalDtype):
+        # Categórica: basta con las categorías que siguen en uso
+        serie = serie.cat.remove_unused_categories().cat.categories.to_series()
+
+    # Únicos y orden con kernels de Arrow; solo se pasa a objetos Python al final
+    unicos = pc.unique(pa.array(serie.dropna()))
+    return unicos.take(pc.sort_indices(unicos)).to_pylist()
 
 
 # ─────────────────────────────────────────────
@@ -181,8 +462,10 @@ def buscar_en_cgspace_api(query: str, page: int = 0, size: int = 50) -> pd.DataF
 if "messages" not in st.session_state:
     st.session_state.messages = []
 
+# None = aún no hay búsqueda; el panel muestra el mensaje de bienvenida
+# (evita copiar el DataFrame completo en cada sesión)
 if "results_df" not in st.session_state:
-    st.session_state.results_df = df_base.copy()
+    st.session_state.results_df = None
 
 # ─────────────────────────────────────────────
 # Layout principal: chat (izquierda) + panel de datos (derecha)
@@ -211,7 +494,7 @@ with col_chat:
         # 1) Llamar a la herramienta adecuada según la fuente de datos
         try:
             if fuente_datos == "CSV local (demo estable)":
-                df_resultados = buscar_localmente(user_input, df_base, max_results=200)
+                df_resultados = buscar_localmente(user_input, max_results=200)
             else:  # API CGSpace
                 df_resultados = buscar_en_cgspace_api(user_input, page=0, size=50)
         except Exception as e:
@@ -297,7 +580,7 @@ with col_panel:
 
             # Filtro por rango de años
             if "Año" in df_res.columns and df_res["Año"].notna().any():
-                años_validos = sorted(df_res["Año"].dropna().unique().tolist())
+                años_validos = valores_unicos_ordenados(df_res["Año"])
 
                 if len(años_validos) > 1:
                     min_year = int(min(años_validos))
@@ -309,9 +592,9 @@ with col_panel:
                         value=(min_year, max_year),
                         step=1,
                     )
+                    # fillna(False): con Año nullable (Arrow) las filas sin año dan NA
                     df_res = df_res[
-                        (df_res["Año"] >= year_range[0])
-                        & (df_res["Año"] <= year_range[1])
+                        ((df_res["Año"] >= year_range[0]) & (df_res["Año"] <= year_range[1])).fillna(False)
                     ]
                 else:
                     # Solo hay un año en los resultados → no usamos slider
@@ -322,7 +605,7 @@ with col_panel:
 
             # Filtro por país
             if "País" in df_res.columns:
-                paises_unicos = sorted(df_res["País"].dropna().unique().tolist())
+                paises_unicos = valores_unicos_ordenados(df_res["País"])
                 if paises_unicos:
                     paises_sel = col_f2.multiselect(
                         "Filtrar por país",
@@ -330,7 +613,12 @@ with col_panel:
                         default=paises_unicos,
                     )
                     if paises_sel:
-                        df_res = df_res[df_res["País"].isin(paises_sel)]
+                        if isinstance(df_res["País"].dtype, pd.CategoricalDtype):
+                            # Comparación sobre los códigos enteros de la categoría
+                            codigos = df_res["País"].cat.categories.get_indexer(paises_sel)
+                            df_res = df_res[df_res["País"].cat.codes.isin(codigos)]
+                        else:
+                            df_res = df_res[df_res["País"].isin(paises_sel)]
                 else:
                     col_f2.write("No hay países disponibles para filtrar.")
 
@@ -358,9 +646,15 @@ with col_panel:
         # ── Gráfico simple: nº de docs por año ───────────────────────────
         if "Año" in df_res.columns and not df_res.empty:
             st.markdown("### Documentos por año")
-            docs_por_anio = df_res.groupby("Año").size().reset_index(name="Documentos")
-            docs_por_anio = docs_por_anio.sort_values("Año")
-            st.bar_chart(docs_por_anio.set_index("Año"))
+            docs_por_anio = (
+                df_res["Año"]
+                .dropna()
+                .astype("int32")
+                .value_counts(sort=False)
+                .sort_index()
+                .rename("Documentos")
+            )
+            st.bar_chart(docs_por_anio)
 
         # ── Tabla de resultados ───────────────────────────
         st.markdown("### Lista de documentos")